@@ -9,11 +9,17 @@ echo "Starting Reddit MCP Server..."
 export OLLAMA_BASE_URL="${OLLAMA_BASE_URL:-http://host.docker.internal:11434}"
 export OLLAMA_MODEL="${OLLAMA_MODEL:-gpt-oss:20b}"
 export PORT="${PORT:-5000}"
+# Caches, summary coalescing and the Reddit rate limiter live in each worker
+# process, so prefer one worker with many threads over many workers
+export WORKERS="${WORKERS:-1}"
+export THREADS="${THREADS:-32}"
 
 echo "Environment variables:"
 echo "  OLLAMA_BASE_URL: $OLLAMA_BASE_URL"
 echo "  OLLAMA_MODEL: $OLLAMA_MODEL"
 echo "  PORT: $PORT"
+echo "  WORKERS: $WORKERS"
+echo "  THREADS: $THREADS"
 
 echo ""
 echo "Starting MCP server on port $PORT..."
@@ -30,7 +36,9 @@ echo "  GET /openapi.json"
 echo ""
 echo "Press Ctrl+C to stop the server"
 
-# Run the MCP server directly with python3
-python3 src/mcp_server.py
+# Run the MCP server under gunicorn; each worker serves THREADS requests
+# concurrently while they wait on Reddit and Ollama
+gunicorn --chdir src -k gthread -w "$WORKERS" --threads "$THREADS" \
+    --timeout 120 -b "0.0.0.0:$PORT" wsgi:app
 
 echo "Server stopped."
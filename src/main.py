@@ -4,16 +4,170 @@ Reddit CLI Interface - Python Implementation
 """
 
 import argparse
+import functools
+import hashlib
+import io
 import os
+import socket
 import sys
+import threading
 import time
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Deque, Dict, Iterator, List, Optional, Tuple
+
+import orjson
+from cachetools import TTLCache
+
+# httpx and rich are imported where they are used so that argument parsing
+# (e.g. --help) doesn't pay for loading them
+if TYPE_CHECKING:
+    import httpx
+
+# Process-wide getaddrinfo memo: (host, port, family, type, proto) -> (expiry, result)
+_dns_cache: Dict[tuple, tuple] = {}
+_orig_getaddrinfo = socket.getaddrinfo
+
+
+def install_dns_cache(ttl: float = 300):
+    """
+    Memoize socket.getaddrinfo so repeat lookups of the Reddit and Ollama
+    hosts are answered locally instead of hitting the resolver
+
+    Args:
+        ttl: Seconds a resolved address stays cached
+    """
+
+    def _cached_getaddrinfo(host, port, family=0, type=0, proto=0, flags=0):
+        key = (host, port, family, type, proto)
+        entry = _dns_cache.get(key)
+        if entry and entry[0] > time.monotonic():
+            return entry[1]
+
+        result = _orig_getaddrinfo(host, port, family, type, proto, flags)
+        _dns_cache[key] = (time.monotonic() + ttl, result)
+        return result
+
+    socket.getaddrinfo = _cached_getaddrinfo
+
+
+@functools.lru_cache(maxsize=1024)
+def _format_timestamp(timestamp: float) -> str:
+    """Format a Unix timestamp, memoized since neighbouring items often share one"""
+    return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(timestamp))
+
+
+def _json(response: "httpx.Response") -> Any:
+    """Decode a JSON response body with orjson"""
+    return orjson.loads(response.content)
+
+
+def _parse_listing(data: Dict[str, Any]) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """
+    Extract posts and the pagination token from a search listing
+
+    Args:
+        data: Decoded search.json response
+
+    Returns:
+        Tuple of (list of post dictionaries, after token or None)
+    """
+    listing = data.get("data")
+    if not listing or "children" not in listing:
+        return [], None
+
+    posts = []
+    for child in listing["children"]:
+        post_data = child.get("data")
+        if not post_data:
+            continue
+        get = post_data.get
+        posts.append(
+            {
+                "id": get("id"),
+                "title": get("title", "No title"),
+                "subreddit": get("subreddit", "unknown"),
+                "created_utc": get("created_utc", 0),
+                "url": get("url", ""),
+                "body": get("selftext", get("body", "")),
+            }
+        )
+
+    return posts, listing.get("after")
+
+
+def _httpx():
+    """Import httpx on first use, keeping it off the startup path"""
+    import httpx
+
+    return httpx
+
+
+def _http_client(**kwargs) -> "httpx.Client":
+    """
+    Build an HTTP/2 client whose keep-alive pool is shared by concurrent
+    requests and which retries failed connection attempts
+    """
+    httpx = _httpx()
+
+    return httpx.Client(
+        transport=httpx.HTTPTransport(
+            http2=True,
+            retries=2,
+            limits=httpx.Limits(
+                max_connections=8,
+                max_keepalive_connections=8,
+                keepalive_expiry=60,
+            ),
+        ),
+        **kwargs,
+    )
+
+
+# Retries for Reddit responses that may succeed later (rate limiting and
+# server errors); the transport itself only retries failed connections
+HTTP_RETRIES = 2
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+def _retry_delay(response: "httpx.Response", attempt: int) -> float:
+    """
+    Seconds to wait before retrying a response, honoring a numeric Retry-After
+
+    Args:
+        response: Response with a retryable status
+        attempt: Zero-based number of the attempt that just failed
+
+    Returns:
+        Delay in seconds, capped at 10
+    """
+    try:
+        delay = float(response.headers["Retry-After"])
+    except (KeyError, ValueError):
+        delay = 0.5 * 2**attempt
+    return min(10.0, max(0.0, delay))
+
+
+# Cache lifetimes (seconds) for Reddit GET responses
+SEARCH_CACHE_TTL = 60
+COMMENTS_CACHE_TTL = 30
+
+# Posts requested per search call, and posts shown per results page; one
+# fetch covers several pages, which are then sliced locally
+SEARCH_FETCH_LIMIT = 100
+PAGE_SIZE = 15
+
+# Results table columns: (header, add_column keyword arguments)
+RESULTS_COLUMNS = (
+    ("Number", {"style": "cyan", "no_wrap": True}),
+    ("Subreddit", {"style": "magenta"}),
+    ("Date", {"style": "green"}),
+    ("Title", {"style": "white"}),
+)
 
-import requests
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
+# Limits on the comments sent to the model for a summary
+SUMMARY_MAX_COMMENTS = 50
+SUMMARY_COMMENT_CHARS = 400
 
 
 class RedditClient:
@@ -21,8 +175,55 @@ class RedditClient:
 
     def __init__(self):
         self.base_url = "https://www.reddit.com"
-        self.session = requests.Session()
-        self.session.headers.update({"User-Agent": "RedditCLI/0.1 by User"})
+        self.session = _http_client(
+            timeout=10.0,
+            headers={
+                "User-Agent": "RedditCLI/0.1 by User",
+                "Accept-Encoding": "gzip, br",
+            },
+        )
+        # Transport errors to wrap; httpx itself is only imported lazily
+        self._http_error = _httpx().HTTPError
+        # One bounded TTL cache per lifetime, keyed by (url, sorted params)
+        self._cache: Dict[int, TTLCache] = {}
+        # Guards the caches, which are shared with background prefetches
+        self._cache_lock = threading.Lock()
+
+    def close(self) -> None:
+        """Close the HTTP client and its pooled connections"""
+        self.session.close()
+
+    def _cached_get_json(
+        self, url: str, params: Optional[Dict[str, Any]] = None, ttl: int = 60
+    ) -> Any:
+        """
+        GET a URL and decode its JSON body, reusing a cached copy within the TTL
+
+        Args:
+            url: Request URL
+            params: Query parameters
+            ttl: Seconds a cached response stays valid
+
+        Returns:
+            Decoded JSON response
+        """
+        key = (url, tuple(sorted((params or {}).items())))
+        with self._cache_lock:
+            cache = self._cache.setdefault(ttl, TTLCache(maxsize=256, ttl=ttl))
+            data = cache.get(key)
+        if data is not None:
+            return data
+
+        for attempt in range(HTTP_RETRIES + 1):
+            response = self.session.get(url, params=params)
+            if response.status_code not in RETRY_STATUSES or attempt == HTTP_RETRIES:
+                break
+            time.sleep(_retry_delay(response, attempt))
+        response.raise_for_status()
+        data = _json(response)
+        with self._cache_lock:
+            cache[key] = data
+        return data
 
     def search_posts(
         self, query: str, limit: int = 15, after: Optional[str] = None
@@ -38,18 +239,23 @@ class RedditClient:
         Returns:
             Dictionary containing search results and pagination info
         """
-        params = {"q": query, "limit": limit, "sort": "hot", "type": "link"}
+        # raw_json=1 stops Reddit from HTML-escaping text fields
+        params = {
+            "q": query,
+            "limit": limit,
+            "sort": "hot",
+            "type": "link",
+            "raw_json": 1,
+        }
 
         if after:
             params["after"] = after
 
         try:
-            response = self.session.get(
-                f"{self.base_url}/search.json", params=params, timeout=10
+            return self._cached_get_json(
+                f"{self.base_url}/search.json", params=params, ttl=SEARCH_CACHE_TTL
             )
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
+        except self._http_error as e:
             raise Exception(f"Failed to fetch posts: {str(e)}")
 
     def get_post_details(self, post_id: str) -> Dict[str, Any]:
@@ -62,45 +268,39 @@ class RedditClient:
         Returns:
             Dictionary with post details
         """
-        try:
-            response = self.session.get(
-                f"{self.base_url}/by_id/t3_{post_id}.json", timeout=10
-            )
-            response.raise_for_status()
-            data = response.json()
+        return self.get_post_and_comments(post_id)[0]
 
-            # Extract post from the response structure
-            if isinstance(data, list) and len(data) > 0:
-                return data[0].get("data", {})
-            elif isinstance(data, dict):
-                return data.get("data", {})
-
-            return {}
-        except requests.exceptions.RequestException as e:
-            raise Exception(f"Failed to fetch post details: {str(e)}")
-
-    def get_post_comments(self, post_id: str, limit: int = 100) -> List[Dict[str, Any]]:
+    def get_post_and_comments(
+        self, post_id: str, limit: int = 100
+    ) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
         """
-        Get comments for a specific post
+        Get a post and its comments with a single request
+
+        The comments endpoint returns a two-element array: a listing holding
+        the post itself, followed by the comment tree.
 
         Args:
             post_id: Reddit post ID
             limit: Maximum number of comments to fetch
 
         Returns:
-            List of comment dictionaries
+            Tuple of (post dictionary, list of comment dictionaries)
         """
         try:
-            response = self.session.get(
+            data = self._cached_get_json(
                 f"{self.base_url}/comments/{post_id}.json",
-                params={"limit": limit},
-                timeout=10,
+                params={"limit": limit, "raw_json": 1},
+                ttl=COMMENTS_CACHE_TTL,
             )
-            response.raise_for_status()
-            data = response.json()
 
-            # Extract comments from the nested structure
+            post = {}
             comments = []
+            if isinstance(data, list) and len(data) > 0:
+                post_children = data[0].get("data", {}).get("children", [])
+                if post_children:
+                    post = post_children[0].get("data", {})
+
+            # Extract comments from the nested structure
             if isinstance(data, list) and len(data) > 1:
                 comment_data = data[1].get("data", {}).get("children", [])
                 for child in comment_data:
@@ -115,10 +315,23 @@ class RedditClient:
                         }
                     )
 
-            return comments
-        except requests.exceptions.RequestException as e:
+            return post, comments
+        except self._http_error as e:
             raise Exception(f"Failed to fetch comments: {str(e)}")
 
+    def get_post_comments(self, post_id: str, limit: int = 100) -> List[Dict[str, Any]]:
+        """
+        Get comments for a specific post
+
+        Args:
+            post_id: Reddit post ID
+            limit: Maximum number of comments to fetch
+
+        Returns:
+            List of comment dictionaries
+        """
+        return self.get_post_and_comments(post_id, limit)[1]
+
     def format_timestamp(self, timestamp: int) -> str:
         """
         Format Unix timestamp into readable date string
@@ -129,7 +342,7 @@ class RedditClient:
         Returns:
             Formatted date string
         """
-        return datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M:%S")
+        return _format_timestamp(timestamp)
 
 
 class AIClient:
@@ -138,19 +351,48 @@ class AIClient:
     def __init__(self):
         self.base_url = os.getenv("OLLAMA_BASE_URL", "http://192.168.8.223:11434")
         self.model = os.getenv("OLLAMA_MODEL", "gpt-oss:20b")
-        self.session = requests.Session()
-
-    def generate_summary(self, post_body: str, comments: List[str]) -> str:
+        self.session = _http_client(
+            timeout=30.0, headers={"Accept-Encoding": "gzip, br"}
+        )
+        # Transport errors to wrap; httpx itself is only imported lazily
+        self._http_error = _httpx().HTTPError
+        self._stream_timeout = _httpx().Timeout(10.0, read=None)
+        # Completed summaries keyed by _summary_key()
+        self._summary_cache: Dict[str, str] = {}
+
+    def close(self) -> None:
+        """Close the HTTP client and its pooled connections"""
+        self.session.close()
+
+    def _summary_key(self, post_id: str, comments: List[str]) -> str:
+        """Build a cache key from the post ID and a sample of its comments"""
+        sample = "|".join(c[:64] for c in comments[:10])
+        return hashlib.blake2b(
+            f"{post_id}|{len(comments)}|{sample}".encode(), digest_size=16
+        ).hexdigest()
+
+    def generate_summary(
+        self, post_id: str, post_body: str, comments: List[str]
+    ) -> Iterator[str]:
         """
-        Generate AI summary of a post with comments
+        Generate AI summary of a post with comments, streamed as it is produced
+
+        Summaries that finished streaming are cached, so asking again for the
+        same post and comments returns immediately without calling the model.
 
         Args:
+            post_id: Reddit post ID
             post_body: The main body text of the post
             comments: List of comment strings
 
         Returns:
-            Generated summary from AI
+            Iterator over chunks of the generated summary
         """
+        key = self._summary_key(post_id, comments)
+        if key in self._summary_cache:
+            yield self._summary_cache[key]
+            return
+
         # Select 100 random comments (or all if less than 100)
         selected_comments = comments[:100]
 
@@ -158,17 +400,36 @@ class AIClient:
         prompt = self._create_prompt(post_body, selected_comments)
 
         try:
-            response = self.session.post(
+            # No read timeout: long generations must not be cut off mid-stream
+            with self.session.stream(
+                "POST",
                 f"{self.base_url}/api/generate",
-                json={"model": self.model, "prompt": prompt, "stream": False},
-                timeout=30,
-            )
-            response.raise_for_status()
+                json={"model": self.model, "prompt": prompt, "stream": True},
+                timeout=self._stream_timeout,
+            ) as response:
+                response.raise_for_status()
+
+                parts = []
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+                    chunk = orjson.loads(line)
+                    # Ollama reports failures mid-stream as an "error" line
+                    if chunk.get("error"):
+                        raise Exception(
+                            f"Failed to generate AI summary: {chunk['error']}"
+                        )
+                    if chunk.get("response"):
+                        parts.append(chunk["response"])
+                        yield chunk["response"]
+                    if chunk.get("done"):
+                        break
 
-            data = response.json()
-            return data.get("response", "").strip()
+                # Only cache summaries that were generated in full
+                if parts:
+                    self._summary_cache[key] = "".join(parts)
 
-        except requests.exceptions.RequestException as e:
+        except self._http_error as e:
             raise Exception(f"Failed to generate AI summary: {str(e)}")
 
     def _create_prompt(self, post_body: str, comments: List[str]) -> str:
@@ -182,13 +443,12 @@ class AIClient:
         Returns:
             Formatted prompt string
         """
-        # Join comments into a single string with proper formatting
-        comments_text = "\n".join(
-            [f"Comment {i + 1}: {comment}" for i, comment in enumerate(comments)]
-        )
+        # Write comments straight into one buffer instead of joining a list
+        buf = io.StringIO()
+        for i, comment in enumerate(comments, 1):
+            buf.write(f"Comment {i}: {comment}\n")
 
-        if not comments_text:
-            comments_text = "No comments available."
+        comments_text = buf.getvalue() or "No comments available."
 
         prompt = f"""
         Summarize the following Reddit post and its comments in 2-3 sentences.
@@ -207,24 +467,43 @@ class AIClient:
 
 class RedditCLI:
     def __init__(self):
+        from rich.console import Console
+
         self.console = Console()
         self.reddit_client = RedditClient()
         self.ai_client = AIClient()
         self.current_page = 0
+        self.page_size = PAGE_SIZE
+        # Index into search_results of the first post on the current page
+        self.page_start = 0
+        # Every post fetched for the current query, across pages
         self.search_results = []
         self.current_post = None
+        self.current_post_index = 0
         self.comments = []
-        self.current_comment_index = 0
+        # (number, comment) pairs for the current post; the front is on screen
+        self._comments_dq: Deque[Tuple[int, Dict[str, Any]]] = deque()
         self.search_query = ""
         self.after_token = None
+        # Background fetch of the page after the one on screen
+        self._executor = ThreadPoolExecutor(max_workers=2)
+        self._prefetch: Optional[Future] = None
+        self._prefetch_key: Optional[tuple] = None
+
+    def close(self):
+        """Stop background prefetching and close both API clients"""
+        self._executor.shutdown(wait=False)
+        self.reddit_client.close()
+        self.ai_client.close()
+
+    def run(self, query: Optional[str] = None):
+        """
+        Main application entry point
 
-    def run(self):
-        """Main application entry point"""
-        parser = argparse.ArgumentParser(description="Reddit CLI Interface")
-        parser.add_argument("query", nargs="?", help="Search query for Reddit")
-        args = parser.parse_args()
-
-        if not args.query:
+        Args:
+            query: Initial search query; prompts for one when omitted
+        """
+        if not query:
             # Show welcome screen
             self.show_welcome()
             # Get search query from user
@@ -246,10 +525,12 @@ class RedditCLI:
                         raise e
         else:
             # Process the provided query
-            self.search(args.query)
+            self.search(query)
 
     def show_welcome(self):
         """Display welcome screen"""
+        from rich.panel import Panel
+
         self.console.print(
             Panel(
                 "Reddit CLI Interface\n\n"
@@ -269,182 +550,148 @@ class RedditCLI:
         self.search_query = query
         self.console.print(f"\nSearching for: [bold blue]{query}[/bold blue]")
 
-        # Retry logic for initial search
-        max_retries = 2
-        retry_delay = 1  # seconds
-
-        for attempt in range(max_retries + 1):
-            try:
-                # Reset pagination state
-                self.after_token = None
-
-                data = self.reddit_client.search_posts(query, limit=15)
-
-                # Extract posts from response
-                posts = []
-
-                # Check if we have data in the expected response format
-                if "data" in data and "children" in data["data"]:
-                    for child in data["data"]["children"]:
-                        post_data = child.get("data", {})
-                        if post_data:
-                            posts.append(
-                                {
-                                    "id": post_data.get("id"),
-                                    "title": post_data.get("title", "No title"),
-                                    "subreddit": post_data.get("subreddit", "unknown"),
-                                    "created_utc": post_data.get("created_utc", 0),
-                                    "url": post_data.get("url", ""),
-                                    "body": post_data.get(
-                                        "selftext", post_data.get("body", "")
-                                    ),
-                                }
-                            )
-
-                    # Get the after token for pagination
-                    self.after_token = data["data"].get("after")
-
-                if not posts:
-                    self.console.print("[yellow]No results found[/yellow]")
-                    # Instead of returning, ask user if they want to search again
-                    while True:
-                        choice = (
-                            input("\nWould you like to perform a new search? (y/n): ")
-                            .strip()
-                            .lower()
-                        )
-                        if choice in ["y", "yes"]:
-                            new_query = input("Enter new search query: ").strip()
-                            if new_query:
-                                self.search(new_query)
-                                return
-                            else:
-                                self.console.print(
-                                    "[yellow]No query provided.[/yellow]"
-                                )
-                                continue
-                        elif choice in ["n", "no"]:
-                            # Return to main menu by raising an exception that gets caught
-                            raise Exception("User requested new search")
-                        else:
-                            self.console.print(
-                                "[red]Please enter 'y' for yes or 'n' for no[/red]"
-                            )
-
-                self.search_results = posts
-                self.current_page = 0
-                self.display_search_results()
-                self.handle_user_input()
-                return  # Success, exit retry loop
-
-            except Exception as e:
-                if attempt < max_retries:
-                    self.console.print(
-                        f"[yellow]Attempt {attempt + 1} failed: {e}[/yellow]"
-                    )
-                    self.console.print(
-                        f"[yellow]Retrying in {retry_delay} seconds...[/yellow]"
-                    )
-                    time.sleep(retry_delay)
-                    retry_delay *= 2  # Exponential backoff
+        # Reset pagination state
+        self.after_token = None
+
+        # Failed connection attempts are retried by the client's transport
+        try:
+            data = self.reddit_client.search_posts(query, limit=SEARCH_FETCH_LIMIT)
+        except Exception as e:
+            self.console.print(f"[red]Error searching: {e}[/red]")
+            self.console.print("[yellow]Please try a new search.[/yellow]")
+            # Re-raise exception so it can be handled by the main loop
+            raise e
+
+        posts, self.after_token = _parse_listing(data)
+
+        if not posts:
+            self.console.print("[yellow]No results found[/yellow]")
+            # Instead of returning, ask user if they want to search again
+            while True:
+                choice = (
+                    input("\nWould you like to perform a new search? (y/n): ")
+                    .strip()
+                    .lower()
+                )
+                if choice in ["y", "yes"]:
+                    new_query = input("Enter new search query: ").strip()
+                    if new_query:
+                        self.search(new_query)
+                        return
+                    else:
+                        self.console.print("[yellow]No query provided.[/yellow]")
+                        continue
+                elif choice in ["n", "no"]:
+                    # Return to main menu by raising an exception that gets caught
+                    raise Exception("User requested new search")
                 else:
                     self.console.print(
-                        f"[red]Error searching after {max_retries + 1} attempts: {e}[/red]"
+                        "[red]Please enter 'y' for yes or 'n' for no[/red]"
                     )
-                    self.console.print("[yellow]Please try a new search.[/yellow]")
-                    # Re-raise exception so it can be handled by the main loop
-                    raise e
+
+        self.search_results = posts
+        self.current_page = 0
+        self.page_start = 0
+        self.display_search_results()
+        self.handle_user_input()
 
     def next_page(self, query: str):
         """Load the next page of search results"""
+        # Serve the page from already-fetched posts when possible
+        next_start = self.page_start + self.page_size
+        if next_start < len(self.search_results):
+            self.page_start = next_start
+            self.current_page += 1
+            self.display_search_results()
+            self.handle_user_input()
+            return
+
         if not self.after_token:
             self.console.print("[yellow]No more pages available[/yellow]")
             return
 
-        # Retry logic for network errors
-        max_retries = 2
-        retry_delay = 1  # seconds
-
-        for attempt in range(max_retries + 1):
-            try:
+        # Failed connection attempts are retried by the client's transport
+        try:
+            if self._prefetch and self._prefetch_key == (query, self.after_token):
+                prefetch, self._prefetch = self._prefetch, None
+                data = prefetch.result(timeout=10)
+            else:
                 data = self.reddit_client.search_posts(
-                    query, limit=15, after=self.after_token
+                    query, limit=SEARCH_FETCH_LIMIT, after=self.after_token
                 )
+        except Exception as e:
+            self.console.print(f"[red]Error loading next page: {e}[/red]")
+            self.console.print(
+                "[yellow]Returning to current results. Try a new search.[/yellow]"
+            )
+            self.display_search_results()
+            # Re-raise exception so it can be handled by the main loop
+            raise e
 
-                # Extract posts from response
-                posts = []
-
-                # Check if we have data in the expected response format
-                if "data" in data and "children" in data["data"]:
-                    for child in data["data"]["children"]:
-                        post_data = child.get("data", {})
-                        if post_data:
-                            posts.append(
-                                {
-                                    "id": post_data.get("id"),
-                                    "title": post_data.get("title", "No title"),
-                                    "subreddit": post_data.get("subreddit", "unknown"),
-                                    "created_utc": post_data.get("created_utc", 0),
-                                    "url": post_data.get("url", ""),
-                                    "body": post_data.get(
-                                        "selftext", post_data.get("body", "")
-                                    ),
-                                }
-                            )
-
-                    # Get the after token for pagination
-                    self.after_token = data["data"].get("after")
-
-                if not posts:
-                    self.console.print("[yellow]No more results found[/yellow]")
-                    return
-
-                self.search_results = posts
-                self.current_page += 1
-
-                self.display_search_results()
-                self.handle_user_input()
-                return  # Success, exit retry loop
-
-            except Exception as e:
-                if attempt < max_retries:
-                    self.console.print(
-                        f"[yellow]Attempt {attempt + 1} failed: {e}[/yellow]"
-                    )
-                    self.console.print(
-                        f"[yellow]Retrying in {retry_delay} seconds...[/yellow]"
-                    )
-                    time.sleep(retry_delay)
-                    retry_delay *= 2  # Exponential backoff
-                else:
-                    self.console.print(
-                        f"[red]Error loading next page after {max_retries + 1} attempts: {e}[/red]"
-                    )
-                    self.console.print(
-                        "[yellow]Returning to current results. Try a new search.[/yellow]"
-                    )
-                    self.display_search_results()
-                    # Re-raise exception so it can be handled by the main loop
-                    raise e
+        posts, self.after_token = _parse_listing(data)
+
+        if not posts:
+            self.console.print("[yellow]No more results found[/yellow]")
+            return
+
+        # The new batch starts a fresh page, even if the last one was short
+        self.page_start = len(self.search_results)
+        self.search_results.extend(posts)
+        self.current_page += 1
+
+        self.display_search_results()
+        self.handle_user_input()
+
+    def _page_bounds(self) -> Tuple[int, int]:
+        """Return the [start, end) slice of search_results on the current page"""
+        start = self.page_start
+        return start, min(start + self.page_size, len(self.search_results))
 
     def display_search_results(self):
         """Display search results in a table format"""
-        table = Table(title=f"Search Results (Page {self.current_page + 1})")
-        table.add_column("Number", style="cyan", no_wrap=True)
-        table.add_column("Subreddit", style="magenta")
-        table.add_column("Date", style="green")
-        table.add_column("Title", style="white")
+        table = self._results_table()
+        table.title = f"Search Results (Page {self.current_page + 1})"
 
-        for i, post in enumerate(self.search_results):
-            # Format date if available
-            formatted_date = self.reddit_client.format_timestamp(post["created_utc"])
+        start, end = self._page_bounds()
+        page_posts = self.search_results[start:end]
 
+        # Format all dates for the page up front
+        format_timestamp = self.reddit_client.format_timestamp
+        dates = [format_timestamp(post["created_utc"]) for post in page_posts]
+
+        for i, (post, formatted_date) in enumerate(zip(page_posts, dates)):
             table.add_row(str(i + 1), post["subreddit"], formatted_date, post["title"])
 
         self.console.print(table)
         self.console.print(
             "\n[blue]Press 'n' for next page, number to select a post, or 'q' to quit[/blue]"
         )
+        self._start_prefetch()
+
+    def _results_table(self):
+        """Return an empty results table with its columns configured"""
+        from rich.table import Table
+
+        table = Table()
+        for header, options in RESULTS_COLUMNS:
+            table.add_column(header, **options)
+        return table
+
+    def _start_prefetch(self):
+        """Fetch the next batch in the background while the user reads its last page"""
+        key = (self.search_query, self.after_token)
+        if not self.after_token or self._prefetch_key == key:
+            return
+        if self._page_bounds()[1] < len(self.search_results):
+            return
+
+        self._prefetch_key = key
+        self._prefetch = self._executor.submit(
+            self.reddit_client.search_posts,
+            self.search_query,
+            SEARCH_FETCH_LIMIT,
+            self.after_token,
+        )
 
     def handle_user_input(self):
         """Handle user interaction and navigation"""
@@ -480,8 +727,9 @@ class RedditCLI:
                     break
 
                 elif user_input.isdigit():
-                    index = int(user_input) - 1
-                    if 0 <= index < len(self.search_results):
+                    start, end = self._page_bounds()
+                    index = start + int(user_input) - 1
+                    if start <= index < end:
                         self.view_post(index)
                     else:
                         self.console.print("[red]Invalid selection[/red]")
@@ -497,17 +745,16 @@ class RedditCLI:
     def view_post(self, index: int):
         """View a selected post with full details"""
         self.current_post = self.search_results[index]
+        self.current_post_index = index
 
-        # Try to get more detailed info
+        # Fetch detailed info and comments in one request
         try:
-            detailed_info = self.reddit_client.get_post_details(self.current_post["id"])
-            if detailed_info:
-                self.current_post.update(detailed_info)
-
-            # Get comments
-            self.comments = self.reddit_client.get_post_comments(
+            detailed_info, self.comments = self.reddit_client.get_post_and_comments(
                 self.current_post["id"], limit=100
             )
+            if detailed_info:
+                self.current_post.update(detailed_info)
+            self._comments_dq = deque(enumerate(self.comments, 1))
 
         except Exception as e:
             self.console.print(f"[red]Error fetching details: {e}[/red]")
@@ -551,19 +798,26 @@ class RedditCLI:
 
     def display_post_details(self):
         """Display full details of a post"""
+        from rich.panel import Panel
+
+        created = self.reddit_client.format_timestamp(
+            self.current_post.get("created_utc", 0)
+        )
         self.console.print(
             Panel(
                 f"[bold blue]{self.current_post.get('title', 'No title')}[/bold blue]\n\n"
                 f"Subreddit: [cyan]{self.current_post.get('subreddit', 'unknown')}[/cyan]\n"
-                f"Created: {self.reddit_client.format_timestamp(self.current_post.get('created_utc', 0))}\n\n"
+                f"Created: {created}\n\n"
                 f"[white]{self.current_post.get('body', '')}[/white]\n",
-                title=f"Post #{self.search_results.index(self.current_post) + 1}",
+                title=f"Post #{self.current_post_index - self._page_bounds()[0] + 1}",
                 border_style="green",
             )
         )
 
     def view_comments(self):
         """View comments with cycling"""
+        from rich.panel import Panel
+
         if not self.comments:
             self.console.print("[yellow]No comments available[/yellow]")
             return
@@ -573,13 +827,13 @@ class RedditCLI:
         try:
             while True:
                 # Display current comment
-                comment = self.comments[self.current_comment_index]
+                number, comment = self._comments_dq[0]
                 self.console.print(
                     Panel(
                         f"Author: [cyan]{comment.get('author', 'unknown')}[/cyan]\n"
                         f"Score: [magenta]{comment.get('score', 0)}[/magenta]\n\n"
                         f"[white]{comment.get('body', '')}[/white]",
-                        title=f"Comment {self.current_comment_index + 1}",
+                        title=f"Comment {number}",
                         border_style="yellow",
                     )
                 )
@@ -594,13 +848,9 @@ class RedditCLI:
                 )
 
                 if user_input == "n":
-                    self.current_comment_index = (self.current_comment_index + 1) % len(
-                        self.comments
-                    )
+                    self._comments_dq.rotate(-1)
                 elif user_input == "p":
-                    self.current_comment_index = (self.current_comment_index - 1) % len(
-                        self.comments
-                    )
+                    self._comments_dq.rotate(1)
                 else:
                     break
 
@@ -608,7 +858,7 @@ class RedditCLI:
             self.console.print("\n[blue]Returning to post...[/blue]")
 
     def view_ai_summary(self):
-        """Get and display AI-generated summary via Ollama"""
+        """Get and display AI-generated summary via Ollama as it streams in"""
         if not self.current_post or not self.comments:
             self.console.print("[red]No content available for summarization[/red]")
             return
@@ -616,30 +866,52 @@ class RedditCLI:
         try:
             body = self.current_post.get("body", "")
 
-            # Get the first 100 comments (or fewer)
-            comment_bodies = [comment.get("body", "") for comment in self.comments]
-
-            summary = self.ai_client.generate_summary(body, comment_bodies)
-
-            if summary:
-                self.console.print(
-                    Panel(
-                        f"[bold green]AI Summary:[/bold green]\n\n{summary}",
-                        title="AI Generated Summary",
-                        border_style="magenta",
-                    )
-                )
-            else:
+            # Keep the highest-scored live comments, trimmed, to bound prompt size
+            ranked = sorted(
+                self.comments, key=lambda c: c.get("score", 0), reverse=True
+            )
+            comment_bodies = [
+                c["body"][:SUMMARY_COMMENT_CHARS]
+                for c in ranked
+                if c.get("body") and c["body"] not in ("[deleted]", "[removed]")
+            ][:SUMMARY_MAX_COMMENTS]
+
+            self.console.print("[bold green]AI Summary:[/bold green]\n")
+
+            received = False
+            for chunk in self.ai_client.generate_summary(
+                self.current_post["id"], body, comment_bodies
+            ):
+                self.console.print(chunk, end="", markup=False, highlight=False)
+                received = True
+            self.console.print()
+
+            if not received:
                 self.console.print("[red]Failed to generate AI summary[/red]")
 
+        except KeyboardInterrupt:
+            self.console.print("\n[yellow]AI summary interrupted[/yellow]")
         except Exception as e:
             self.console.print(f"[red]Error generating AI summary: {e}[/red]")
 
 
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command-line arguments"""
+    parser = argparse.ArgumentParser(description="Reddit CLI Interface")
+    parser.add_argument("query", nargs="?", help="Search query for Reddit")
+    return parser.parse_args(argv)
+
+
 def main():
     """Main function to run the CLI application"""
+    # Parse first so --help exits before rich and httpx are loaded
+    args = parse_args()
+    install_dns_cache()
     app = RedditCLI()
-    app.run()
+    try:
+        app.run(args.query)
+    finally:
+        app.close()
 
 
 if __name__ == "__main__":
@@ -5,15 +5,25 @@ Exposes Reddit querying capabilities through MCP endpoints with resilience and r
 """
 
 import asyncio
-import json
+import hashlib
+import io
 import logging
+import math
 import os
+import threading
 import time
-from typing import Any, Dict, List, Optional
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from operator import attrgetter
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from urllib.parse import quote
 
+import orjson
 import requests
-from flask import Flask, jsonify, request
+from cachetools import TTLCache, cachedmethod
+from cachetools.keys import hashkey
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry, make_headers
+from flask import Flask, Response, request
 from flask_cors import CORS
 
 # Configure logging
@@ -29,6 +39,196 @@ OLLAMA_BASE_URL = os.getenv("OLLAMA_BASE_URL", "http://home.ms:4000")
 OLLAMA_MODEL = os.getenv("OLLAMA_MODEL", "gpt-oss:20b")
 REDDIT_BASE_URL = "https://www.reddit.com"
 
+# Constant search query parameters, shared by every search request
+_SEARCH_DEFAULTS = (("sort", "hot"), ("type", "link"))
+
+# Seconds before a slow search is hedged with a duplicate request; set near
+# the p95 search latency so only the slowest few percent are duplicated
+SEARCH_HEDGE_AFTER = 1.0
+
+# Request threads per gunicorn worker (run_mcp_server.sh passes --threads)
+REQUEST_THREADS = max(1, int(os.getenv("THREADS", "32")))
+
+# Client-side Reddit request budget for the whole server (requests per second,
+# burst size). Each gunicorn worker process has its own bucket, so the rate is
+# split evenly across the WORKERS processes started by run_mcp_server.sh; the
+# burst never drops below the three Reddit calls a single request can make
+REDDIT_WORKERS = max(1, int(os.getenv("WORKERS", "1")))
+REDDIT_RATE = 1.0 / REDDIT_WORKERS
+REDDIT_BURST = max(3.0, 5 / REDDIT_WORKERS)
+
+# How many times a rate-limited (429) request is retried through that budget,
+# and the longest a request waits for budget before failing instead
+REDDIT_RATE_LIMIT_RETRIES = 3
+REDDIT_MAX_WAIT = 5.0
+
+# Fixed instructions sent as Ollama's system prompt on every summary request
+SYSTEM_PROMPT = (
+    "You summarize Reddit discussions. Reply with a concise 2-3 sentence "
+    "summary of the post and the main points raised in its comments."
+)
+
+# Limits on the text sent to the model for a summary, to bound prompt size
+SUMMARY_MAX_COMMENTS = 100
+SUMMARY_COMMENT_CHARS = 500
+SUMMARY_POST_CHARS = 4000
+
+
+def _mount_pooled_adapter(
+    session: requests.Session,
+    retry_statuses: Tuple[int, ...] = (429, 500, 502, 503, 504),
+) -> None:
+    """
+    Mount a keep-alive connection pool large enough for concurrent Flask workers
+
+    Failed requests are retried by urllib3 with jittered exponential backoff
+    capped at 4s, honoring Retry-After on rate-limit responses when 429 is
+    one of the retried statuses.
+
+    Args:
+        session: Session to mount the adapter on
+        retry_statuses: Response status codes that are retried
+    """
+    retries = Retry(
+        total=3,
+        backoff_factor=0.5,
+        backoff_jitter=0.3,
+        backoff_max=4.0,
+        status_forcelist=retry_statuses,
+        allowed_methods=("GET", "POST"),
+        # With this on, urllib3 retries any 429 that carries Retry-After even
+        # when 429 isn't in status_forcelist, so tie it to the status list
+        respect_retry_after_header=429 in retry_statuses,
+    )
+    adapter = HTTPAdapter(
+        max_retries=retries, pool_connections=32, pool_maxsize=64, pool_block=False
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+
+def _method_key(name: str):
+    """Build a cachedmethod key function that namespaces keys by method name"""
+    return lambda self, *args, **kwargs: hashkey(name, *args, **kwargs)
+
+
+def ojsonify(obj: Any, status: int = 200) -> Response:
+    """
+    Serialize an object to a JSON response with orjson
+
+    Args:
+        obj: JSON-serializable object
+        status: HTTP status code
+
+    Returns:
+        Flask response with an application/json body
+    """
+    return Response(orjson.dumps(obj), status=status, mimetype='application/json')
+
+
+class TokenBucket:
+    """Thread-safe token bucket whose refill rate adapts to rate limiting (AIMD)"""
+
+    def __init__(self, rate: float, capacity: float, min_rate: Optional[float] = None):
+        self.base_rate = rate
+        self.rate = rate
+        self.capacity = capacity
+        # Penalties never slow the bucket below this (default: 1/20 of rate)
+        self.min_rate = rate / 20 if min_rate is None else min_rate
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        """Add the tokens accrued since the last update (caller holds the lock)"""
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def wait_time(self, tokens: float = 1.0) -> float:
+        """
+        Seconds until the requested tokens would be available
+
+        Args:
+            tokens: Number of tokens wanted
+
+        Returns:
+            Wait time in seconds (0 if available now)
+        """
+        with self._lock:
+            self._refill()
+            return max(0.0, (tokens - self._tokens) / self.rate)
+
+    def take(self, tokens: float = 1.0, max_wait: Optional[float] = None) -> bool:
+        """
+        Take tokens, sleeping until the bucket can cover them
+
+        Args:
+            tokens: Number of tokens to take
+            max_wait: Longest acceptable sleep in seconds (None for no limit)
+
+        Returns:
+            True once the tokens are taken, or False without taking any if
+            that would mean sleeping longer than max_wait
+        """
+        with self._lock:
+            self._refill()
+            delay = max(0.0, (tokens - self._tokens) / self.rate)
+            if max_wait is not None and delay > max_wait:
+                return False
+            # Reserve now so concurrent callers queue behind each other
+            self._tokens -= tokens
+        if delay:
+            time.sleep(delay)
+        return True
+
+    def penalize(self, retry_after: float = 0.0) -> None:
+        """
+        Halve the refill rate after a rate-limit response
+
+        Args:
+            retry_after: Seconds the server asked us to wait before retrying
+        """
+        with self._lock:
+            self._refill()
+            self.rate = max(self.min_rate, self.rate / 2)
+            if retry_after > 0:
+                # Hold back tokens so the next single-token take() waits
+                # at least retry_after seconds
+                self._tokens = min(self._tokens, 1 - retry_after * self.rate)
+
+    def reward(self) -> None:
+        """Additively restore the refill rate after a successful request"""
+        with self._lock:
+            if self.rate < self.base_rate:
+                self._refill()
+                self.rate = min(self.base_rate, self.rate + self.base_rate / 10)
+
+
+def _retry_after_seconds(response: requests.Response) -> float:
+    """
+    Read a numeric Retry-After header, capped at a minute
+
+    Args:
+        response: Rate-limited response
+
+    Returns:
+        Seconds to wait, or 0 if the header is missing or not a number
+    """
+    try:
+        return min(60.0, max(0.0, float(response.headers.get("Retry-After", 0))))
+    except ValueError:
+        return 0.0
+
+
+class RedditRateLimited(Exception):
+    """Raised when the Reddit request budget can't cover a request in time"""
+
+    def __init__(self, retry_after: float):
+        super().__init__("Reddit request budget exhausted, try again shortly")
+        self.retry_after = retry_after
+
+
 class RedditClient:
     """Client for interacting with Reddit API with retry logic"""
 
@@ -36,38 +236,86 @@ class RedditClient:
         self.base_url = REDDIT_BASE_URL
         self.session = requests.Session()
         self.session.headers.update({"User-Agent": "RedditCLI/0.1 by User"})
+        # Advertise every encoding urllib3 can decode here (br when brotli is
+        # installed); bodies are decoded transparently and read via .content
+        self.session.headers.update(make_headers(accept_encoding=True))
+        # 429s are left to the rate limiter below rather than urllib3's retries
+        _mount_pooled_adapter(self.session, retry_statuses=(500, 502, 503, 504))
+        self._rate_limiter = TokenBucket(REDDIT_RATE, REDDIT_BURST)
+        # Parsed responses, shared by all request threads
+        self._cache = TTLCache(maxsize=2048, ttl=300)
+        self._cache_lock = threading.Lock()
+        # ETag/Last-Modified validators and parsed bodies for conditional GETs
+        self._validators = TTLCache(maxsize=256, ttl=3600)
+        self._validators_lock = threading.Lock()
+        # Runs hedged search attempts; the losing request finishes unobserved.
+        # Sized for a first attempt plus a hedge from every request thread so
+        # a burst of searches never queues behind the pool
+        self._hedge_executor = ThreadPoolExecutor(max_workers=2 * REQUEST_THREADS)
 
-    def _make_request_with_retry(self, url: str, params: Dict = None, max_retries: int = 3, 
-                               retry_delay: float = 1.0) -> requests.Response:
+    def close(self) -> None:
+        """Close pooled connections and stop the hedging worker threads"""
+        self._hedge_executor.shutdown(wait=False)
+        self.session.close()
+
+    def _get_json(self, url: str, params: Optional[List[Tuple[str, Any]]] = None) -> Any:
         """
-        Make HTTP request with exponential backoff retry logic
-        
+        GET a Reddit JSON endpoint, revalidating earlier responses
+
+        When a previous response carried an ETag or Last-Modified header the
+        request is made conditional, and a 304 reuses the stored body without
+        downloading or parsing it again. Requests are paced by the client's
+        token bucket, which slows down whenever Reddit answers 429; a request
+        that would wait more than REDDIT_MAX_WAIT for budget raises
+        RedditRateLimited instead.
+
         Args:
             url: Request URL
             params: Request parameters
-            max_retries: Maximum number of retry attempts
-            retry_delay: Initial delay between retries (seconds)
-            
+
         Returns:
-            Response object
-            
-        Raises:
-            requests.exceptions.RequestException: If all retries fail
+            Decoded JSON response
         """
-        for attempt in range(max_retries + 1):
-            try:
-                response = self.session.get(url, params=params, timeout=10)
-                response.raise_for_status()
-                return response
-            except requests.exceptions.RequestException as e:
-                if attempt < max_retries:
-                    logger.warning(f"Attempt {attempt + 1} failed: {e}. Retrying in {retry_delay} seconds...")
-                    time.sleep(retry_delay)
-                    retry_delay *= 2  # Exponential backoff
-                else:
-                    logger.error(f"All {max_retries + 1} attempts failed for {url}")
-                    raise e
+        key = (url, tuple(params or ()))
+        with self._validators_lock:
+            entry = self._validators.get(key)
+
+        headers = {}
+        if entry:
+            etag, last_modified, _ = entry
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+
+        for _ in range(REDDIT_RATE_LIMIT_RETRIES + 1):
+            if not self._rate_limiter.take(max_wait=REDDIT_MAX_WAIT):
+                raise RedditRateLimited(self._rate_limiter.wait_time())
+            # Short connect timeout so an unreachable host fails fast
+            response = self.session.get(
+                url, params=params, headers=headers, timeout=(3.05, 10)
+            )
+            if response.status_code != 429:
+                self._rate_limiter.reward()
+                break
+            logger.warning(f"Rate limited by Reddit for {url}; slowing down")
+            self._rate_limiter.penalize(_retry_after_seconds(response))
 
+        if entry and response.status_code == 304:
+            return entry[2]
+        response.raise_for_status()
+
+        data = orjson.loads(response.content)
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag or last_modified:
+            with self._validators_lock:
+                self._validators[key] = (etag, last_modified, data)
+        return data
+
+    @cachedmethod(
+        attrgetter("_cache"), key=_method_key("search"), lock=attrgetter("_cache_lock")
+    )
     def search_posts(
         self, query: str, limit: int = 15, after: Optional[str] = None
     ) -> Dict[str, Any]:
@@ -82,19 +330,123 @@ class RedditClient:
         Returns:
             Dictionary containing search results and pagination info
         """
-        params = {"q": query, "limit": limit, "sort": "hot", "type": "link"}
+        params = [("q", query), ("limit", limit), *_SEARCH_DEFAULTS]
 
         if after:
-            params["after"] = after
+            params.append(("after", after))
 
         try:
-            response = self._make_request_with_retry(
-                f"{self.base_url}/search.json", params=params
-            )
-            return response.json()
+            data = self._get_json(f"{self.base_url}/search.json", params=params)
         except requests.exceptions.RequestException as e:
             raise Exception(f"Failed to fetch posts: {str(e)}")
 
+        self._seed_post_details(data)
+        return data
+
+    def _seed_post_details(self, data: Dict[str, Any]) -> None:
+        """
+        Cache each post in a search listing as its get_post_details result
+
+        Listing entries carry the same fields as /by_id, so opening a post
+        that was just returned by a search needs no extra request.
+
+        Args:
+            data: Decoded search.json response
+        """
+        with self._cache_lock:
+            for child in data.get("data", {}).get("children", ()):
+                post_data = child.get("data")
+                if post_data and post_data.get("id"):
+                    self._cache.setdefault(hashkey("details", post_data["id"]), post_data)
+
+    def search_posts_hedged(
+        self,
+        query: str,
+        limit: int = 15,
+        after: Optional[str] = None,
+        hedge_after: float = SEARCH_HEDGE_AFTER,
+    ) -> Dict[str, Any]:
+        """
+        Search for Reddit posts, hedging slow requests with a second attempt
+
+        If the first request hasn't answered within hedge_after seconds an
+        identical one is sent, and whichever succeeds first is returned.
+        No hedge is sent while the rate limiter has no token to spare.
+
+        Args:
+            query: Search terms
+            limit: Number of posts to return (default 15)
+            after: Pagination token for next page
+            hedge_after: Seconds to wait before sending the second request
+
+        Returns:
+            Dictionary containing search results and pagination info
+        """
+        with self._cache_lock:
+            data = self._cache.get(hashkey("search", query, limit, after))
+        if data is not None:
+            return data
+
+        # While the rate limiter is backlogged a slow answer is just queueing,
+        # and a duplicate request would only deepen the backlog
+        if self._rate_limiter.wait_time() > 0:
+            return self.search_posts(query, limit, after)
+
+        pending = {self._hedge_executor.submit(self.search_posts, query, limit, after)}
+        done, pending = wait(pending, timeout=hedge_after)
+        if not done and self._rate_limiter.wait_time() == 0:
+            pending.add(
+                self._hedge_executor.submit(self.search_posts, query, limit, after)
+            )
+
+        error = None
+        while pending or done:
+            for future in done:
+                try:
+                    return future.result()
+                except Exception as e:
+                    error = e
+            if not pending:
+                break
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        raise error
+
+    def get_posts_info(self, post_ids: List[str]) -> List[Dict[str, Any]]:
+        """
+        Get detailed information about several posts with retry logic
+
+        Cached posts are served directly; the rest are fetched together from
+        /api/info, up to 100 IDs per request.
+
+        Args:
+            post_ids: Reddit post IDs
+
+        Returns:
+            List of post detail dictionaries in the requested order, omitting
+            posts Reddit did not return
+        """
+        with self._cache_lock:
+            found = {pid: self._cache.get(hashkey("details", pid)) for pid in post_ids}
+        missing = [pid for pid, post in found.items() if post is None]
+
+        for start in range(0, len(missing), 100):
+            batch = missing[start:start + 100]
+            try:
+                data = self._get_json(
+                    f"{self.base_url}/api/info.json",
+                    params=[("id", ",".join(f"t3_{pid}" for pid in batch))],
+                )
+            except requests.exceptions.RequestException as e:
+                raise Exception(f"Failed to fetch post details: {str(e)}")
+
+            self._seed_post_details(data)
+            for child in data.get("data", {}).get("children", ()):
+                post_data = child.get("data")
+                if post_data and post_data.get("id") in found:
+                    found[post_data["id"]] = post_data
+
+        return [found[pid] for pid in post_ids if found[pid]]
+
     def get_post_details(self, post_id: str) -> Dict[str, Any]:
         """
         Get detailed information about a specific post with retry logic
@@ -105,22 +457,12 @@ class RedditClient:
         Returns:
             Dictionary with post details
         """
-        try:
-            response = self._make_request_with_retry(
-                f"{self.base_url}/by_id/t3_{post_id}.json"
-            )
-            data = response.json()
-
-            # Extract post from the response structure
-            if isinstance(data, list) and len(data) > 0:
-                return data[0].get("data", {})
-            elif isinstance(data, dict):
-                return data.get("data", {})
-
-            return {}
-        except requests.exceptions.RequestException as e:
-            raise Exception(f"Failed to fetch post details: {str(e)}")
+        posts = self.get_posts_info([post_id])
+        return posts[0] if posts else {}
 
+    @cachedmethod(
+        attrgetter("_cache"), key=_method_key("comments"), lock=attrgetter("_cache_lock")
+    )
     def get_post_comments(self, post_id: str, limit: int = 100) -> List[Dict[str, Any]]:
         """
         Get comments for a specific post with retry logic
@@ -133,44 +475,32 @@ class RedditClient:
             List of comment dictionaries
         """
         try:
-            response = self._make_request_with_retry(
-                f"{self.base_url}/comments/{post_id}.json",
-                params={"limit": limit}
+            data = self._get_json(
+                f"{self.base_url}/comments/{post_id}.json", params=[("limit", limit)]
             )
-            data = response.json()
 
             # Extract comments from the nested structure
+            if not (isinstance(data, list) and len(data) > 1):
+                return []
+
+            comment_data = data[1].get("data", {}).get("children", [])
             comments = []
-            if isinstance(data, list) and len(data) > 1:
-                comment_data = data[1].get("data", {}).get("children", [])
-                for child in comment_data:
-                    comment = child.get("data", {})
-                    # Flatten the comment structure to include author and body
-                    comments.append(
-                        {
-                            "author": comment.get("author", "unknown"),
-                            "body": comment.get("body", ""),
-                            "score": comment.get("score", 0),
-                            "created_utc": comment.get("created_utc", 0),
-                        }
-                    )
+            for child in comment_data:
+                get = child.get("data", {}).get
+                # Flatten the comment structure to include author and body
+                comments.append(
+                    {
+                        "author": get("author", "unknown"),
+                        "body": get("body", ""),
+                        "score": get("score", 0),
+                        "created_utc": get("created_utc", 0),
+                    }
+                )
 
             return comments
         except requests.exceptions.RequestException as e:
             raise Exception(f"Failed to fetch comments: {str(e)}")
 
-    def format_timestamp(self, timestamp: int) -> str:
-        """
-        Format Unix timestamp into readable date string
-
-        Args:
-            timestamp: Unix timestamp
-
-        Returns:
-            Formatted date string
-        """
-        return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(timestamp))
-
 
 class AIClient:
     """Client for interacting with OpenAPI AI API with retry logic"""
@@ -179,66 +509,78 @@ class AIClient:
         self.base_url = OLLAMA_BASE_URL
         self.model = OLLAMA_MODEL
         self.session = requests.Session()
+        _mount_pooled_adapter(self.session)
         # Set the API key for the new endpoint
         self.api_key = "111"  # As specified in the feedback
+        # Send the API key as a Bearer token on every request
+        self.session.headers.update({"Authorization": f"Bearer {self.api_key}"})
 
-    def _make_request_with_retry(self, url: str, json_data: Dict = None, max_retries: int = 3, 
-                               retry_delay: float = 1.0) -> requests.Response:
+    def close(self) -> None:
+        """Close pooled connections"""
+        self.session.close()
+
+    def generate_summary(self, post_body: str, comments: List[str]) -> str:
         """
-        Make HTTP request with exponential backoff retry logic
-        
+        Generate AI summary of a post with comments and retry logic
+
         Args:
-            url: Request URL
-            json_data: JSON data to send
-            max_retries: Maximum number of retry attempts
-            retry_delay: Initial delay between retries (seconds)
-            
+            post_body: The main body text of the post
+            comments: List of comment strings
+
         Returns:
-            Response object
-            
-        Raises:
-            requests.exceptions.RequestException: If all retries fail
+            Generated summary from AI
         """
-        for attempt in range(max_retries + 1):
-            try:
-                # Add API key to Authorization header as Bearer token
-                headers = {"Authorization": f"Bearer {self.api_key}"}
-                response = self.session.post(url, json=json_data, headers=headers, timeout=30)
-                response.raise_for_status()
-                return response
-            except requests.exceptions.RequestException as e:
-                if attempt < max_retries:
-                    logger.warning(f"Attempt {attempt + 1} failed: {e}. Retrying in {retry_delay} seconds...")
-                    time.sleep(retry_delay)
-                    retry_delay *= 2  # Exponential backoff
-                else:
-                    logger.error(f"All {max_retries + 1} attempts failed for {url}")
-                    raise e
+        return "".join(self.stream_summary(post_body, comments)).strip()
 
-    def generate_summary(self, post_body: str, comments: List[str]) -> str:
+    def stream_summary(self, post_body: str, comments: List[str]) -> Iterator[str]:
         """
-        Generate AI summary of a post with comments and retry logic
+        Stream an AI summary of a post with comments as it is generated
+
+        The fixed instructions go in the stable system field and the model is
+        kept loaded between calls, so Ollama can reuse its cached prefix.
 
         Args:
             post_body: The main body text of the post
             comments: List of comment strings
 
         Returns:
-            Generated summary from AI
+            Iterator over chunks of the generated summary
         """
-        # Select 100 random comments (or all if less than 100)
-        selected_comments = comments[:100]
+        # Clamp the post and each comment so long threads stay within num_ctx
+        selected_comments = [c[:SUMMARY_COMMENT_CHARS] for c in comments[:SUMMARY_MAX_COMMENTS]]
 
         # Format prompt for the AI model
-        prompt = self._create_prompt(post_body, selected_comments)
+        prompt = self._create_prompt(post_body[:SUMMARY_POST_CHARS], selected_comments)
 
         try:
-            response = self._make_request_with_retry(
+            # The read timeout bounds each wait for the next chunk, not the
+            # whole generation, so a hung Ollama fails instead of blocking
+            response = self.session.post(
                 f"{self.base_url}/api/generate",
-                json={"model": self.model, "prompt": prompt, "stream": False}
+                json={
+                    "model": self.model,
+                    "prompt": prompt,
+                    "system": SYSTEM_PROMPT,
+                    "stream": True,
+                    "keep_alive": "30m",
+                    "options": {"num_ctx": 4096},
+                },
+                timeout=(10, 60),
+                stream=True,
             )
-            data = response.json()
-            return data.get("response", "").strip()
+            with response:
+                response.raise_for_status()
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+                    chunk = orjson.loads(line)
+                    # Ollama reports failures mid-stream as an "error" line
+                    if chunk.get("error"):
+                        raise Exception(f"Failed to generate AI summary: {chunk['error']}")
+                    if chunk.get("response"):
+                        yield chunk["response"]
+                    if chunk.get("done"):
+                        break
         except requests.exceptions.RequestException as e:
             raise Exception(f"Failed to generate AI summary: {str(e)}")
 
@@ -253,72 +595,180 @@ class AIClient:
         Returns:
             Formatted prompt string
         """
-        # Join comments into a single string with proper formatting
-        comments_text = "\n".join(
-            [f"Comment {i + 1}: {comment}" for i, comment in enumerate(comments)]
-        )
+        # Write the whole prompt into one buffer instead of joining a list
+        # of comment strings and interpolating the result into a template
+        buf = io.StringIO()
+        buf.write("Summarize the following Reddit post and its comments in 2-3 sentences.\n\n")
+        buf.write("Post:\n")
+        buf.write(post_body)
+        buf.write("\n\nComments:\n")
+        for i, comment in enumerate(comments, 1):
+            buf.write(f"Comment {i}: {comment}\n")
+        if not comments:
+            buf.write("No comments available.\n")
+        buf.write("\nSummary:\n")
 
-        if not comments_text:
-            comments_text = "No comments available."
+        return buf.getvalue()
 
-        prompt = f"""
-        Summarize the following Reddit post and its comments in 2-3 sentences.
 
-        Post:
-        {post_body}
+def _extract_posts(data: Dict[str, Any]) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """
+    Extract posts and the pagination token from a search listing
 
-        Comments:
-        {comments_text}
+    Args:
+        data: Decoded search.json response
 
-        Summary:
-        """
+    Returns:
+        Tuple of (list of post dictionaries, after token or None)
+    """
+    listing = data.get("data", {})
+
+    posts = []
+    for child in listing.get("children", ()):
+        post_data = child.get("data")
+        if not post_data:
+            continue
+        get = post_data.get
+        posts.append(
+            {
+                "id": get("id"),
+                "title": get("title", "No title"),
+                "subreddit": get("subreddit", "unknown"),
+                "created_utc": get("created_utc", 0),
+                "url": get("url", ""),
+                "body": get("selftext", get("body", "")),
+                "score": get("score", 0),
+            }
+        )
 
-        return prompt
+    return posts, listing.get("after")
 
 
 # Initialize clients
 reddit_client = RedditClient()
 ai_client = AIClient()
 
+# Shared worker pool for short upstream calls that can run side by side
+executor = ThreadPoolExecutor(max_workers=8)
+
+# Separate pool for Ollama generations, which take tens of seconds and must
+# not hold up the Reddit fetches queued on executor
+summary_executor = ThreadPoolExecutor(max_workers=8)
+
+# Recently completed summaries, and generations still running, by post ID;
+# concurrent requests for the same post share one Ollama call
+_summary_cache = TTLCache(maxsize=256, ttl=60)
+_summary_inflight: Dict[str, Future] = {}
+_summary_lock = threading.Lock()
+
+
+def _generate_and_cache_summary(post_id: str, post_body: str, comments: List[str]) -> str:
+    """
+    Generate a summary and store it in the short-lived summary cache
+
+    Args:
+        post_id: Reddit post ID
+        post_body: The main body text of the post
+        comments: List of comment strings
+
+    Returns:
+        Generated summary from AI
+    """
+    try:
+        summary = ai_client.generate_summary(post_body, comments)
+        # An empty summary means the generation failed; let the next caller retry
+        if summary:
+            with _summary_lock:
+                _summary_cache[post_id] = summary
+        return summary
+    finally:
+        with _summary_lock:
+            _summary_inflight.pop(post_id, None)
+
+
+async def _coalesced_summary(post_id: str, post_body: str, comments: List[str]) -> str:
+    """
+    Get a post's summary, joining any generation already running for it
+
+    Args:
+        post_id: Reddit post ID
+        post_body: The main body text of the post
+        comments: List of comment strings
+
+    Returns:
+        Generated summary from AI
+    """
+    with _summary_lock:
+        summary = _summary_cache.get(post_id)
+        if summary:
+            return summary
+        future = _summary_inflight.get(post_id)
+        if future is None:
+            future = summary_executor.submit(
+                _generate_and_cache_summary, post_id, post_body, comments
+            )
+            _summary_inflight[post_id] = future
+    return await asyncio.wrap_future(future)
+
+
+def _stream_and_cache_summary(post_id: str, post_body: str, comments: List[str]) -> Iterator[str]:
+    """
+    Stream a summary, caching it once the model has finished
+
+    Args:
+        post_id: Reddit post ID
+        post_body: The main body text of the post
+        comments: List of comment strings
+
+    Returns:
+        Iterator over chunks of the generated summary
+    """
+    with _summary_lock:
+        summary = _summary_cache.get(post_id)
+    if summary:
+        yield summary
+        return
+
+    parts = []
+    for chunk in ai_client.stream_summary(post_body, comments):
+        parts.append(chunk)
+        yield chunk
+
+    summary = "".join(parts).strip()
+    if summary:
+        with _summary_lock:
+            _summary_cache[post_id] = summary
+
+
+def _rate_limited_response(error: RedditRateLimited) -> Response:
+    """
+    Build a 503 response telling the caller when the Reddit budget refills
+
+    Args:
+        error: Rate-limit error raised by the Reddit client
+
+    Returns:
+        Flask response with a Retry-After header in whole seconds
+    """
+    response = ojsonify({"error": str(error)}, 503)
+    response.headers["Retry-After"] = str(max(1, math.ceil(error.retry_after)))
+    return response
+
+
 @app.route('/search', methods=['GET'])
 def search_posts():
     """Search for Reddit posts"""
     try:
         query = request.args.get('q', '')
-        limit = int(request.args.get('limit', 15))
+        limit = request.args.get('limit', 15, type=int)
         after = request.args.get('after', None)
         
         if not query:
-            return jsonify({"error": "Query parameter 'q' is required"}), 400
+            return ojsonify({"error": "Query parameter 'q' is required"}, 400)
             
-        data = reddit_client.search_posts(query, limit, after)
+        data = reddit_client.search_posts_hedged(query, limit, after)
         
-        # Extract posts from response
-        posts = []
-        
-        # Check if we have data in the expected response format
-        if "data" in data and "children" in data["data"]:
-            for child in data["data"]["children"]:
-                post_data = child.get("data", {})
-                if post_data:
-                    posts.append(
-                        {
-                            "id": post_data.get("id"),
-                            "title": post_data.get("title", "No title"),
-                            "subreddit": post_data.get("subreddit", "unknown"),
-                            "created_utc": post_data.get("created_utc", 0),
-                            "url": post_data.get("url", ""),
-                            "body": post_data.get(
-                                "selftext", post_data.get("body", "")
-                            ),
-                            "score": post_data.get("score", 0),
-                        }
-                    )
-            
-            # Get the after token for pagination
-            after_token = data["data"].get("after")
-        else:
-            after_token = None
+        posts, after_token = _extract_posts(data)
             
         response_data = {
             "posts": posts,
@@ -327,11 +777,14 @@ def search_posts():
             "limit": limit
         }
         
-        return jsonify(response_data)
+        return ojsonify(response_data)
         
+    except RedditRateLimited as e:
+        logger.warning(f"Rate limited in search_posts: {e}")
+        return _rate_limited_response(e)
     except Exception as e:
         logger.error(f"Error in search_posts: {e}")
-        return jsonify({"error": str(e)}), 500
+        return ojsonify({"error": str(e)}, 500)
 
 
 @app.route('/posts/<post_id>', methods=['GET'])
@@ -341,7 +794,7 @@ def get_post_details(post_id):
         post_data = reddit_client.get_post_details(post_id)
         
         if not post_data:
-            return jsonify({"error": "Post not found"}), 404
+            return ojsonify({"error": "Post not found"}, 404)
             
         # Format the response
         response_data = {
@@ -357,18 +810,21 @@ def get_post_details(post_id):
             "num_comments": post_data.get("num_comments", 0)
         }
         
-        return jsonify(response_data)
+        return ojsonify(response_data)
         
+    except RedditRateLimited as e:
+        logger.warning(f"Rate limited in get_post_details: {e}")
+        return _rate_limited_response(e)
     except Exception as e:
         logger.error(f"Error in get_post_details: {e}")
-        return jsonify({"error": str(e)}), 500
+        return ojsonify({"error": str(e)}, 500)
 
 
 @app.route('/posts/<post_id>/comments', methods=['GET'])
 def get_post_comments(post_id):
     """Get comments for a specific post"""
     try:
-        limit = int(request.args.get('limit', 100))
+        limit = request.args.get('limit', 100, type=int)
         comments = reddit_client.get_post_comments(post_id, limit)
         
         response_data = {
@@ -377,30 +833,68 @@ def get_post_comments(post_id):
             "count": len(comments)
         }
         
-        return jsonify(response_data)
+        return ojsonify(response_data)
         
+    except RedditRateLimited as e:
+        logger.warning(f"Rate limited in get_post_comments: {e}")
+        return _rate_limited_response(e)
     except Exception as e:
         logger.error(f"Error in get_post_comments: {e}")
-        return jsonify({"error": str(e)}), 500
+        return ojsonify({"error": str(e)}, 500)
+
+
+def _summary_events(chunks: Iterator[str]) -> Iterator[bytes]:
+    """
+    Wrap summary chunks as server-sent events
+
+    Args:
+        chunks: Iterator over chunks of the generated summary
+
+    Returns:
+        Iterator over encoded SSE messages, ending with a 'done' event
+    """
+    try:
+        for chunk in chunks:
+            yield b"data: " + orjson.dumps({"chunk": chunk}) + b"\n\n"
+    except Exception as e:
+        logger.error(f"Error streaming summary: {e}")
+        yield b"event: error\ndata: " + orjson.dumps({"error": str(e)}) + b"\n\n"
+        return
+    yield b"event: done\ndata: {}\n\n"
 
 
 @app.route('/posts/<post_id>/summary', methods=['GET'])
-def get_post_summary(post_id):
+async def get_post_summary(post_id):
     """Get AI-generated summary for a post"""
     try:
-        # First get the post details
-        post_data = reddit_client.get_post_details(post_id)
+        # Fetch the post details and comments concurrently
+        loop = asyncio.get_running_loop()
+        post_data, comments = await asyncio.gather(
+            loop.run_in_executor(executor, reddit_client.get_post_details, post_id),
+            loop.run_in_executor(executor, reddit_client.get_post_comments, post_id, 100),
+        )
         if not post_data:
-            return jsonify({"error": "Post not found"}), 404
-            
-        # Get comments
-        comments = reddit_client.get_post_comments(post_id, limit=100)
+            return ojsonify({"error": "Post not found"}, 404)
         
         # Generate summary
         post_body = post_data.get("selftext", post_data.get("body", ""))
-        comment_bodies = [comment.get("body", "") for comment in comments]
-        
-        summary = ai_client.generate_summary(post_body, comment_bodies)
+        # Highest-scored comments first, so truncation keeps the most relevant
+        ranked = sorted(comments, key=lambda c: c.get("score", 0), reverse=True)
+        comment_bodies = [
+            comment["body"]
+            for comment in ranked
+            if comment.get("body") and comment["body"] not in ("[deleted]", "[removed]")
+        ]
+
+        # Server-sent events stream the summary as the model produces it
+        if (request.args.get('stream') == 'true'
+                or request.accept_mimetypes.best == 'text/event-stream'):
+            return Response(
+                _summary_events(_stream_and_cache_summary(post_id, post_body, comment_bodies)),
+                mimetype='text/event-stream'
+            )
+
+        summary = await _coalesced_summary(post_id, post_body, comment_bodies)
         
         response_data = {
             "post_id": post_id,
@@ -409,54 +903,26 @@ def get_post_summary(post_id):
             "subreddit": post_data.get("subreddit", "unknown")
         }
         
-        return jsonify(response_data)
+        return ojsonify(response_data)
         
+    except RedditRateLimited as e:
+        logger.warning(f"Rate limited in get_post_summary: {e}")
+        return _rate_limited_response(e)
     except Exception as e:
         logger.error(f"Error in get_post_summary: {e}")
-        return jsonify({"error": str(e)}), 500
+        return ojsonify({"error": str(e)}, 500)
 
 
 @app.route('/trending', methods=['GET'])
 def get_trending():
     """Get trending posts"""
     try:
-        limit = int(request.args.get('limit', 15))
+        limit = request.args.get('limit', 15, type=int)
         after = request.args.get('after', None)
         
-        # Use the same search parameters but with different sort
-        params = {"q": "all", "limit": limit, "sort": "top", "type": "link"}
-        
-        if after:
-            params["after"] = after
-            
         data = reddit_client.search_posts("all", limit, after)
         
-        # Extract posts from response
-        posts = []
-        
-        # Check if we have data in the expected response format
-        if "data" in data and "children" in data["data"]:
-            for child in data["data"]["children"]:
-                post_data = child.get("data", {})
-                if post_data:
-                    posts.append(
-                        {
-                            "id": post_data.get("id"),
-                            "title": post_data.get("title", "No title"),
-                            "subreddit": post_data.get("subreddit", "unknown"),
-                            "created_utc": post_data.get("created_utc", 0),
-                            "url": post_data.get("url", ""),
-                            "body": post_data.get(
-                                "selftext", post_data.get("body", "")
-                            ),
-                            "score": post_data.get("score", 0),
-                        }
-                    )
-            
-            # Get the after token for pagination
-            after_token = data["data"].get("after")
-        else:
-            after_token = None
+        posts, after_token = _extract_posts(data)
             
         response_data = {
             "posts": posts,
@@ -464,312 +930,345 @@ def get_trending():
             "limit": limit
         }
         
-        return jsonify(response_data)
+        return ojsonify(response_data)
         
+    except RedditRateLimited as e:
+        logger.warning(f"Rate limited in get_trending: {e}")
+        return _rate_limited_response(e)
     except Exception as e:
         logger.error(f"Error in get_trending: {e}")
-        return jsonify({"error": str(e)}), 500
-
+        return ojsonify({"error": str(e)}, 500)
 
-@app.route('/health', methods=['GET'])
-def health_check():
-    """Health check endpoint"""
-    return jsonify({"status": "healthy", "service": "reddit-mcp-server"})
 
+# Static responses, serialized once at import time
+_HEALTH_BYTES = b'{"status":"healthy","service":"reddit-mcp-server"}'
 
-@app.route('/openapi.json', methods=['GET'])
-def openapi_spec():
-    """Serve OpenAPI specification"""
-    spec = {
-        "openapi": "3.0.0",
-        "info": {
-            "title": "Reddit MCP API",
-            "version": "1.0.0",
-            "description": "API for querying Reddit posts with MCP server capabilities"
-        },
-        "servers": [
-            {
-                "url": "http://localhost:5000",
-                "description": "Local development server"
-            }
-        ],
-        "paths": {
-            "/search": {
-                "get": {
-                    "summary": "Search Reddit posts",
-                    "description": "Search for Reddit posts by query term",
-                    "parameters": [
-                        {
-                            "name": "q",
-                            "in": "query",
-                            "required": True,
-                            "schema": {
-                                "type": "string"
-                            },
-                            "description": "Search query"
+_OPENAPI_SPEC = {
+    "openapi": "3.0.0",
+    "info": {
+        "title": "Reddit MCP API",
+        "version": "1.0.0",
+        "description": "API for querying Reddit posts with MCP server capabilities"
+    },
+    "servers": [
+        {
+            "url": "http://localhost:5000",
+            "description": "Local development server"
+        }
+    ],
+    "paths": {
+        "/search": {
+            "get": {
+                "summary": "Search Reddit posts",
+                "description": "Search for Reddit posts by query term",
+                "parameters": [
+                    {
+                        "name": "q",
+                        "in": "query",
+                        "required": True,
+                        "schema": {
+                            "type": "string"
                         },
-                        {
-                            "name": "limit",
-                            "in": "query",
-                            "required": False,
-                            "schema": {
-                                "type": "integer",
-                                "default": 15
-                            },
-                            "description": "Number of posts to return"
+                        "description": "Search query"
+                    },
+                    {
+                        "name": "limit",
+                        "in": "query",
+                        "required": False,
+                        "schema": {
+                            "type": "integer",
+                            "default": 15
                         },
-                        {
-                            "name": "after",
-                            "in": "query",
-                            "required": False,
-                            "schema": {
-                                "type": "string"
-                            },
-                            "description": "Pagination token"
-                        }
-                    ],
-                    "responses": {
-                        "200": {
-                            "description": "Successful response",
-                            "content": {
-                                "application/json": {
-                                    "schema": {
-                                        "type": "object",
-                                        "properties": {
-                                            "posts": {
-                                                "type": "array",
-                                                "items": {
-                                                    "type": "object",
-                                                    "properties": {
-                                                        "id": {"type": "string"},
-                                                        "title": {"type": "string"},
-                                                        "subreddit": {"type": "string"},
-                                                        "created_utc": {"type": "integer"},
-                                                        "url": {"type": "string"},
-                                                        "body": {"type": "string"},
-                                                        "score": {"type": "integer"}
-                                                    }
+                        "description": "Number of posts to return"
+                    },
+                    {
+                        "name": "after",
+                        "in": "query",
+                        "required": False,
+                        "schema": {
+                            "type": "string"
+                        },
+                        "description": "Pagination token"
+                    }
+                ],
+                "responses": {
+                    "200": {
+                        "description": "Successful response",
+                        "content": {
+                            "application/json": {
+                                "schema": {
+                                    "type": "object",
+                                    "properties": {
+                                        "posts": {
+                                            "type": "array",
+                                            "items": {
+                                                "type": "object",
+                                                "properties": {
+                                                    "id": {"type": "string"},
+                                                    "title": {"type": "string"},
+                                                    "subreddit": {"type": "string"},
+                                                    "created_utc": {"type": "integer"},
+                                                    "url": {"type": "string"},
+                                                    "body": {"type": "string"},
+                                                    "score": {"type": "integer"}
                                                 }
-                                            },
-                                            "after": {"type": "string"},
-                                            "query": {"type": "string"},
-                                            "limit": {"type": "integer"}
-                                        }
+                                            }
+                                        },
+                                        "after": {"type": "string"},
+                                        "query": {"type": "string"},
+                                        "limit": {"type": "integer"}
                                     }
                                 }
                             }
                         }
                     }
                 }
-            },
-            "/posts/{post_id}": {
-                "get": {
-                    "summary": "Get post details",
-                    "description": "Get detailed information about a specific post",
-                    "parameters": [
-                        {
-                            "name": "post_id",
-                            "in": "path",
-                            "required": True,
-                            "schema": {
-                                "type": "string"
-                            },
-                            "description": "Reddit post ID"
-                        }
-                    ],
-                    "responses": {
-                        "200": {
-                            "description": "Successful response",
-                            "content": {
-                                "application/json": {
-                                    "schema": {
-                                        "type": "object",
-                                        "properties": {
-                                            "id": {"type": "string"},
-                                            "title": {"type": "string"},
-                                            "subreddit": {"type": "string"},
-                                            "created_utc": {"type": "integer"},
-                                            "url": {"type": "string"},
-                                            "body": {"type": "string"},
-                                            "score": {"type": "integer"},
-                                            "author": {"type": "string"},
-                                            "permalink": {"type": "string"},
-                                            "num_comments": {"type": "integer"}
-                                        }
+            }
+        },
+        "/posts/{post_id}": {
+            "get": {
+                "summary": "Get post details",
+                "description": "Get detailed information about a specific post",
+                "parameters": [
+                    {
+                        "name": "post_id",
+                        "in": "path",
+                        "required": True,
+                        "schema": {
+                            "type": "string"
+                        },
+                        "description": "Reddit post ID"
+                    }
+                ],
+                "responses": {
+                    "200": {
+                        "description": "Successful response",
+                        "content": {
+                            "application/json": {
+                                "schema": {
+                                    "type": "object",
+                                    "properties": {
+                                        "id": {"type": "string"},
+                                        "title": {"type": "string"},
+                                        "subreddit": {"type": "string"},
+                                        "created_utc": {"type": "integer"},
+                                        "url": {"type": "string"},
+                                        "body": {"type": "string"},
+                                        "score": {"type": "integer"},
+                                        "author": {"type": "string"},
+                                        "permalink": {"type": "string"},
+                                        "num_comments": {"type": "integer"}
                                     }
                                 }
                             }
                         }
                     }
                 }
-            },
-            "/posts/{post_id}/comments": {
-                "get": {
-                    "summary": "Get post comments",
-                    "description": "Get comments for a specific post",
-                    "parameters": [
-                        {
-                            "name": "post_id",
-                            "in": "path",
-                            "required": True,
-                            "schema": {
-                                "type": "string"
-                            },
-                            "description": "Reddit post ID"
+            }
+        },
+        "/posts/{post_id}/comments": {
+            "get": {
+                "summary": "Get post comments",
+                "description": "Get comments for a specific post",
+                "parameters": [
+                    {
+                        "name": "post_id",
+                        "in": "path",
+                        "required": True,
+                        "schema": {
+                            "type": "string"
                         },
-                        {
-                            "name": "limit",
-                            "in": "query",
-                            "required": False,
-                            "schema": {
-                                "type": "integer",
-                                "default": 100
-                            },
-                            "description": "Maximum number of comments to return"
-                        }
-                    ],
-                    "responses": {
-                        "200": {
-                            "description": "Successful response",
-                            "content": {
-                                "application/json": {
-                                    "schema": {
-                                        "type": "object",
-                                        "properties": {
-                                            "post_id": {"type": "string"},
-                                            "comments": {
-                                                "type": "array",
-                                                "items": {
-                                                    "type": "object",
-                                                    "properties": {
-                                                        "author": {"type": "string"},
-                                                        "body": {"type": "string"},
-                                                        "score": {"type": "integer"},
-                                                        "created_utc": {"type": "integer"}
-                                                    }
+                        "description": "Reddit post ID"
+                    },
+                    {
+                        "name": "limit",
+                        "in": "query",
+                        "required": False,
+                        "schema": {
+                            "type": "integer",
+                            "default": 100
+                        },
+                        "description": "Maximum number of comments to return"
+                    }
+                ],
+                "responses": {
+                    "200": {
+                        "description": "Successful response",
+                        "content": {
+                            "application/json": {
+                                "schema": {
+                                    "type": "object",
+                                    "properties": {
+                                        "post_id": {"type": "string"},
+                                        "comments": {
+                                            "type": "array",
+                                            "items": {
+                                                "type": "object",
+                                                "properties": {
+                                                    "author": {"type": "string"},
+                                                    "body": {"type": "string"},
+                                                    "score": {"type": "integer"},
+                                                    "created_utc": {"type": "integer"}
                                                 }
-                                            },
-                                            "count": {"type": "integer"}
-                                        }
+                                            }
+                                        },
+                                        "count": {"type": "integer"}
                                     }
                                 }
                             }
                         }
                     }
                 }
-            },
-            "/posts/{post_id}/summary": {
-                "get": {
-                    "summary": "Get AI summary",
-                    "description": "Get AI-generated summary for a post",
-                    "parameters": [
-                        {
-                            "name": "post_id",
-                            "in": "path",
-                            "required": True,
-                            "schema": {
-                                "type": "string"
+            }
+        },
+        "/posts/{post_id}/summary": {
+            "get": {
+                "summary": "Get AI summary",
+                "description": "Get AI-generated summary for a post",
+                "parameters": [
+                    {
+                        "name": "post_id",
+                        "in": "path",
+                        "required": True,
+                        "schema": {
+                            "type": "string"
+                        },
+                        "description": "Reddit post ID"
+                    },
+                    {
+                        "name": "stream",
+                        "in": "query",
+                        "required": False,
+                        "schema": {
+                            "type": "boolean",
+                            "default": False
+                        },
+                        "description": "Stream the summary as server-sent events (also selected by 'Accept: text/event-stream')"
+                    }
+                ],
+                "responses": {
+                    "200": {
+                        "description": "Successful response",
+                        "content": {
+                            "text/event-stream": {
+                                "schema": {
+                                    "type": "string"
+                                }
                             },
-                            "description": "Reddit post ID"
-                        }
-                    ],
-                    "responses": {
-                        "200": {
-                            "description": "Successful response",
-                            "content": {
-                                "application/json": {
-                                    "schema": {
-                                        "type": "object",
-                                        "properties": {
-                                            "post_id": {"type": "string"},
-                                            "summary": {"type": "string"},
-                                            "post_title": {"type": "string"},
-                                            "subreddit": {"type": "string"}
-                                        }
+                            "application/json": {
+                                "schema": {
+                                    "type": "object",
+                                    "properties": {
+                                        "post_id": {"type": "string"},
+                                        "summary": {"type": "string"},
+                                        "post_title": {"type": "string"},
+                                        "subreddit": {"type": "string"}
                                     }
                                 }
                             }
                         }
                     }
                 }
-            },
-            "/trending": {
-                "get": {
-                    "summary": "Get trending posts",
-                    "description": "Get trending Reddit posts",
-                    "parameters": [
-                        {
-                            "name": "limit",
-                            "in": "query",
-                            "required": False,
-                            "schema": {
-                                "type": "integer",
-                                "default": 15
-                            },
-                            "description": "Number of posts to return"
+            }
+        },
+        "/trending": {
+            "get": {
+                "summary": "Get trending posts",
+                "description": "Get trending Reddit posts",
+                "parameters": [
+                    {
+                        "name": "limit",
+                        "in": "query",
+                        "required": False,
+                        "schema": {
+                            "type": "integer",
+                            "default": 15
                         },
-                        {
-                            "name": "after",
-                            "in": "query",
-                            "required": False,
-                            "schema": {
-                                "type": "string"
-                            },
-                            "description": "Pagination token"
-                        }
-                    ],
-                    "responses": {
-                        "200": {
-                            "description": "Successful response",
-                            "content": {
-                                "application/json": {
-                                    "schema": {
-                                        "type": "object",
-                                        "properties": {
-                                            "posts": {
-                                                "type": "array",
-                                                "items": {
-                                                    "type": "object",
-                                                    "properties": {
-                                                        "id": {"type": "string"},
-                                                        "title": {"type": "string"},
-                                                        "subreddit": {"type": "string"},
-                                                        "created_utc": {"type": "integer"},
-                                                        "url": {"type": "string"},
-                                                        "body": {"type": "string"},
-                                                        "score": {"type": "integer"}
-                                                    }
+                        "description": "Number of posts to return"
+                    },
+                    {
+                        "name": "after",
+                        "in": "query",
+                        "required": False,
+                        "schema": {
+                            "type": "string"
+                        },
+                        "description": "Pagination token"
+                    }
+                ],
+                "responses": {
+                    "200": {
+                        "description": "Successful response",
+                        "content": {
+                            "application/json": {
+                                "schema": {
+                                    "type": "object",
+                                    "properties": {
+                                        "posts": {
+                                            "type": "array",
+                                            "items": {
+                                                "type": "object",
+                                                "properties": {
+                                                    "id": {"type": "string"},
+                                                    "title": {"type": "string"},
+                                                    "subreddit": {"type": "string"},
+                                                    "created_utc": {"type": "integer"},
+                                                    "url": {"type": "string"},
+                                                    "body": {"type": "string"},
+                                                    "score": {"type": "integer"}
                                                 }
-                                            },
-                                            "after": {"type": "string"},
-                                            "limit": {"type": "integer"}
-                                        }
+                                            }
+                                        },
+                                        "after": {"type": "string"},
+                                        "limit": {"type": "integer"}
                                     }
                                 }
                             }
                         }
                     }
                 }
-            },
-            "/health": {
-                "get": {
-                    "summary": "Health check",
-                    "description": "Check if the service is running",
-                    "responses": {
-                        "200": {
-                            "description": "Service is healthy"
-                        }
+            }
+        },
+        "/health": {
+            "get": {
+                "summary": "Health check",
+                "description": "Check if the service is running",
+                "responses": {
+                    "200": {
+                        "description": "Service is healthy"
                     }
                 }
             }
         }
     }
-    
-    return jsonify(spec)
+}
+
+_OPENAPI_BYTES = orjson.dumps(_OPENAPI_SPEC)
+_OPENAPI_ETAG = hashlib.blake2b(_OPENAPI_BYTES, digest_size=16).hexdigest()
+
+
+@app.route('/health', methods=['GET'])
+def health_check():
+    """Health check endpoint"""
+    return Response(_HEALTH_BYTES, mimetype='application/json')
+
+
+@app.route('/openapi.json', methods=['GET'])
+def openapi_spec():
+    """Serve OpenAPI specification"""
+    # Clients that send the current ETag get a bodiless 304
+    response = Response(_OPENAPI_BYTES, mimetype='application/json')
+    response.set_etag(_OPENAPI_ETAG)
+    return response.make_conditional(request)
 
 
 def main():
-    """Main function to start the MCP server"""
+    """
+    Main function to start the MCP server with the Flask development server
+
+    Production deployments should run wsgi:app under gunicorn instead
+    (see run_mcp_server.sh).
+    """
     port = int(os.environ.get('PORT', 5000))
     logger.info(f"Starting Reddit MCP Server on port {port}")
     app.run(host='0.0.0.0', port=port, debug=False)
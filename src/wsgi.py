@@ -0,0 +1,9 @@
+#!/usr/bin/env python3
+"""
+WSGI entrypoint for the MCP server
+Run under a production server, e.g. `gunicorn --chdir src -k gthread wsgi:app`.
+"""
+
+from mcp_server import app
+
+__all__ = ["app"]
@@ -6,56 +6,65 @@ This module contains unit tests for the Reddit CLI application components.
 """
 
 import os
+import re
 import sys
-import unittest
 
-# Add the project directory to Python path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import pytest
 
-from ai_client import AIClient
-from reddit_client import RedditClient
+# Add the repository root to Python path so the src package is importable
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+# The CLI module is imported in the fixtures, so collecting these tests doesn't
+# load the CLI or its dependencies
 
-class TestRedditClient(unittest.TestCase):
-    """Test cases for RedditClient class"""
+# Instructions followed by numbered comments, matched in a single scan
+PROMPT_PATTERN = re.compile(r"Summarize.*Comment 1:", re.S)
 
-    def setUp(self):
-        """Set up test fixtures before each test method."""
-        self.client = RedditClient()
 
-    def test_client_initialization(self):
-        """Test that RedditClient initializes correctly"""
-        self.assertIsNotNone(self.client)
-        self.assertEqual(self.client.base_url, "https://www.reddit.com")
+@pytest.fixture(scope="module")
+def reddit_client():
+    """RedditClient shared by all tests in this module."""
+    from src.main import RedditClient
 
-    def test_prompt_creation(self):
-        """Test prompt creation functionality"""
-        client = AIClient()
+    client = RedditClient()
+    yield client
+    client.close()
 
-        # Test with sample data
-        post_body = "This is a test post body"
-        comments = ["First comment", "Second comment"]
 
-        prompt = client._create_prompt(post_body, comments)
+@pytest.fixture(scope="module")
+def ai_client():
+    """AIClient shared by all tests in this module."""
+    from src.main import AIClient
 
-        self.assertIn("Summarize", prompt)
-        self.assertIn(post_body, prompt)
-        self.assertIn("Comment 1:", prompt)
+    client = AIClient()
+    yield client
+    client.close()
 
 
-class TestAIClient(unittest.TestCase):
-    """Test cases for AIClient class"""
+def test_reddit_client_initialization(reddit_client):
+    """Test that RedditClient initializes correctly"""
+    assert reddit_client is not None
+    assert reddit_client.base_url == "https://www.reddit.com"
 
-    def setUp(self):
-        """Set up test fixtures before each test method."""
-        self.client = AIClient()
 
-    def test_client_initialization(self):
-        """Test that AIClient initializes correctly"""
-        self.assertIsNotNone(self.client)
-        self.assertEqual(self.client.model, "gpt-oss:20b")
+def test_ai_client_initialization(ai_client):
+    """Test that AIClient initializes correctly"""
+    assert ai_client is not None
+    assert ai_client.model == "gpt-oss:20b"
+
+
+def test_prompt_creation(ai_client):
+    """Test prompt creation functionality"""
+    # Test with sample data
+    post_body = "This is a test post body"
+    comments = ["First comment", "Second comment"]
+
+    prompt = ai_client._create_prompt(post_body, comments)
+
+    assert PROMPT_PATTERN.search(prompt)
+    assert post_body in prompt
 
 
 if __name__ == "__main__":
     # Run the tests
-    unittest.main(verbosity=2)
+    sys.exit(pytest.main([__file__, "-v"]))
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Reddit CLI - Token Bucket Tests
+
+Unit tests for the MCP server's adaptive Reddit rate limiter, run against a
+fake clock so no test actually sleeps.
+"""
+
+import importlib
+import os
+import sys
+
+import orjson
+import pytest
+
+# Add the src directory to Python path
+sys.path.insert(
+    0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+)
+
+import mcp_server
+from mcp_server import TokenBucket
+
+
+class FakeTime:
+    """Stand-in for the time module that advances only when slept"""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Fake clock patched into the mcp_server module."""
+    fake = FakeTime()
+    monkeypatch.setattr(mcp_server, "time", fake)
+    return fake
+
+
+def test_burst_is_available_immediately(clock):
+    """Test that up to capacity tokens are taken without sleeping"""
+    bucket = TokenBucket(rate=1.0, capacity=2)
+
+    assert bucket.take()
+    assert bucket.take()
+    assert clock.sleeps == []
+    assert bucket.wait_time() == pytest.approx(1.0)
+
+
+def test_take_sleeps_for_missing_tokens(clock):
+    """Test that an empty bucket sleeps until a token has refilled"""
+    bucket = TokenBucket(rate=2.0, capacity=1)
+    bucket.take()
+
+    assert bucket.take()
+    assert clock.sleeps == [pytest.approx(0.5)]
+
+
+def test_take_fails_fast_past_max_wait(clock):
+    """Test that take() refuses waits longer than max_wait without reserving"""
+    bucket = TokenBucket(rate=1.0, capacity=1)
+    bucket.take()
+
+    assert not bucket.take(max_wait=0.5)
+    assert clock.sleeps == []
+    assert bucket.wait_time() == pytest.approx(1.0)
+    assert bucket.take(max_wait=1.0)
+
+
+def test_refill_is_capped_at_capacity(clock):
+    """Test that idle time never accrues more than capacity tokens"""
+    bucket = TokenBucket(rate=1.0, capacity=3)
+    clock.now += 60
+
+    for _ in range(3):
+        bucket.take()
+    assert clock.sleeps == []
+    assert bucket.wait_time() == pytest.approx(1.0)
+
+
+def test_penalize_halves_rate_down_to_minimum(clock):
+    """Test that each 429 halves the rate, never below min_rate"""
+    bucket = TokenBucket(rate=1.0, capacity=5, min_rate=0.3)
+
+    bucket.penalize()
+    assert bucket.rate == pytest.approx(0.5)
+    bucket.penalize()
+    assert bucket.rate == pytest.approx(0.3)
+
+
+def test_reward_restores_rate_additively(clock):
+    """Test that successes add back a tenth of the base rate up to the base"""
+    bucket = TokenBucket(rate=1.0, capacity=5)
+    bucket.penalize()
+
+    bucket.reward()
+    assert bucket.rate == pytest.approx(0.6)
+    for _ in range(10):
+        bucket.reward()
+    assert bucket.rate == pytest.approx(1.0)
+
+
+def test_penalize_holds_back_for_retry_after(clock):
+    """Test that the next take() waits at least the server's Retry-After"""
+    bucket = TokenBucket(rate=1.0, capacity=5)
+
+    bucket.penalize(retry_after=3.0)
+    assert bucket.wait_time() == pytest.approx(3.0)
+
+    bucket.take()
+    assert clock.sleeps == [pytest.approx(3.0)]
+
+
+def test_reddit_request_fails_fast_when_budget_exhausted(clock, monkeypatch):
+    """Test that RedditClient errors instead of queueing past REDDIT_MAX_WAIT"""
+    client = mcp_server.RedditClient()
+    client._rate_limiter = TokenBucket(rate=0.1, capacity=1)
+    client._rate_limiter.take()
+
+    def fail_get(*args, **kwargs):
+        raise AssertionError("request sent without rate-limit budget")
+
+    monkeypatch.setattr(client.session, "get", fail_get)
+    with pytest.raises(mcp_server.RedditRateLimited) as excinfo:
+        client._get_json("https://www.reddit.com/search.json")
+    assert excinfo.value.retry_after == pytest.approx(10.0)
+    client.close()
+
+
+def test_exhausted_budget_returns_503_with_retry_after(clock, monkeypatch):
+    """Test that handlers turn an exhausted budget into 503 + Retry-After"""
+    client = mcp_server.RedditClient()
+    client._rate_limiter = TokenBucket(rate=0.1, capacity=1)
+    client._rate_limiter.take()
+    monkeypatch.setattr(mcp_server, "reddit_client", client)
+
+    response = mcp_server.app.test_client().get("/posts/abc123/comments")
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "10"
+    client.close()
+
+
+class FakeResponse:
+    """Minimal requests.Response stand-in for canned Reddit JSON"""
+
+    status_code = 200
+    headers = {}
+
+    def __init__(self, payload):
+        self.content = orjson.dumps(payload)
+
+    def raise_for_status(self):
+        pass
+
+
+@pytest.fixture
+def multi_worker_server(monkeypatch):
+    """mcp_server reloaded as one of 17 gunicorn workers."""
+    monkeypatch.setenv("WORKERS", "17")
+    yield importlib.reload(mcp_server)
+    monkeypatch.undo()
+    importlib.reload(mcp_server)
+
+
+def test_cold_summary_fits_a_split_budget(multi_worker_server, monkeypatch):
+    """Test that a cold /summary succeeds when the budget is split by WORKERS"""
+    server = multi_worker_server
+    post = {"id": "abc123", "title": "Title", "subreddit": "python", "selftext": "Body"}
+    comment = {"author": "someone", "body": "Comment", "score": 1}
+
+    def fake_get(url, **kwargs):
+        if url.endswith("/api/info.json"):
+            return FakeResponse({"data": {"children": [{"data": post}]}})
+        return FakeResponse([{}, {"data": {"children": [{"data": comment}]}}])
+
+    monkeypatch.setattr(server.reddit_client.session, "get", fake_get)
+    monkeypatch.setattr(
+        server.ai_client, "generate_summary", lambda body, comments: "Summary"
+    )
+
+    response = server.app.test_client().get("/posts/abc123/summary")
+
+    assert server.REDDIT_RATE == pytest.approx(1.0 / 17)
+    assert response.status_code == 200
+    assert response.get_json()["summary"] == "Summary"